@@ -7,7 +7,6 @@
 # import a few useful libraries
 import pandas as pd
 import numpy as np
-import math
 
 from matplotlib import pyplot as plt
 
@@ -69,7 +68,7 @@ def calculate_saturation_vapor_pressure(T):
     Given T (temperature) as an input in Kelvin,
     return the saturation vapour pressure of air.
     """
-    return 0.611 * math.exp((17.3 * T)/(T + 237.3))
+    return 0.611 * np.exp((17.3 * T)/(T + 237.3))
     
 
 
@@ -79,10 +78,11 @@ def calculate_saturation_vapor_pressure(T):
 def calculate_blackbody_radiation(T):
     """
     Given T (temperature) as an input in Kelvin,
-    return the saturation vapour pressure of air.
+    return the radiation emitted by a blackbody (W/m^2).
+    Note that `**` is exponentiation in Python (`^` is bitwise XOR).
     """
     sigma=5.670374419e-8
-    return sigma*(T^4)
+    return sigma*(T**4)
 
 
 # In[6]:
@@ -91,10 +91,11 @@ def calculate_blackbody_radiation(T):
 def calculate_greybody_radiation(T,emiss):
     """
     Given T (temperature) as an input in Kelvin,
-    return the saturation vapour pressure of air.
+    and emiss (emissivity), return the radiation
+    emitted by a greybody (W/m^2).
     """
     sigma=5.670374419e-8
-    return sigma*emiss*(T^4)
+    return sigma*emiss*(T**4)
 
 
 # In[7]:
@@ -115,7 +116,7 @@ def calculate_saturation_vapor_pressure_C(Tc):
     return the saturation vapour pressure of air.
     """
     T=Tc+273;
-    e = 0.611 * math.exp((17.3 * T/(T + 237.3)))
+    e = 0.611 * np.exp((17.3 * T/(T + 237.3)))
     return e
 
 
@@ -127,7 +128,7 @@ def calculate_dewpoint_temperature(e):
     Given e (temperature) as an input in Kelvin,
     return the saturation vapour pressure of air.
     """
-    return 0.611 * math.exp((17.3 * T)/(T + 237.3))
+    return 0.611 * np.exp((17.3 * T)/(T + 237.3))
 
 
 # In[10]:
@@ -135,12 +136,9 @@ def calculate_dewpoint_temperature(e):
 
 # Now, calculate the saturation vapour pressure for the range of temperature we defined above
 temp = 10
-# create an empty array to store the vapour pressures we will calculate
-vapour_pressures = []
-# loop through the range of temperatures we defined above
-for t in temperature_range:
-    sat_vapour_pressure = calculate_saturation_vapor_pressure(t)
-    vapour_pressures.append(sat_vapour_pressure)
+# np.exp works on whole arrays, so we can pass in the full range
+# of temperatures at once instead of looping through them one by one
+vapour_pressures = calculate_saturation_vapor_pressure(temperature_range)
 
 
 # In[11]:
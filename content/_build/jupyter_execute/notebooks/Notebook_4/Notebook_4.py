@@ -140,10 +140,10 @@ stage_range = np.linspace(0.001, 1.5, 100)
 bf_df = pd.DataFrame()
 bf_df['stage'] = stage_range
 
-# now as before, apply the `ols_rc_q` function to create the stage-discharge
-# curve based on the best-fit equation
-bf_df['best_fit_q'] = [ols_rc_q(log_slope, log_intercept, h, 0.0) for h in stage_range]
-bf_df.sort_values(by='stage', inplace=True)
+# now as before, use the `ols_rc_q` function to create the stage-discharge
+# curve based on the best-fit equation.  np.log and np.exp work on whole
+# arrays, so we can pass in the full stage range at once instead of looping
+bf_df['best_fit_q'] = ols_rc_q(log_slope, log_intercept, stage_range, 0.0)
 
 
 # ## Calculate Daily Average Discharge
@@ -154,10 +154,8 @@ bf_df.sort_values(by='stage', inplace=True)
 # In[11]:
 
 
-stage_df['RC Q (cms)'] = stage_df['Value'].apply(lambda h: ols_rc_q(log_slope, log_intercept, h, 0))
-stage_df['Date'] = stage_df.apply(lambda row: pd.to_datetime('{}-{}-{}'.format(row['year'], 
-                                                                               row['month'],
-                                                                              row['day'])), axis=1)
+stage_df['RC Q (cms)'] = ols_rc_q(log_slope, log_intercept, stage_df['Value'], 0)
+stage_df['Date'] = pd.to_datetime(stage_df[['year', 'month', 'day']])
 
 
 # In[12]:
@@ -305,21 +303,20 @@ print('SITE DATA: Start date = {}, End date = {}'.format(stage_df.index[0], stag
 
 # ### Obtain Concurrent Data
 # 
-# In the previous step, we can see that the regional dataset encompasses the date range of our site data.  To perform a regression, we want to use concurrent data only.   The `concat`, or concatenate, function [documentation can be found here](https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.concat.html). 
+# In the previous step, we can see that the regional dataset encompasses the date range of our site data.  To perform a regression, we want to use concurrent data only.   The `Index.intersection` function finds the dates common to both datasets ([documentation can be found here](https://pandas.pydata.org/docs/reference/api/pandas.Index.intersection.html)), and `.loc` selects just the values we need on those dates. 
 
 # In[16]:
 
 
 # create a new dataframe of concurrent data and plot the data
-# join='inner' says to line up the indices and get the values that are common between the two dataframes
-# axis=1 says line up columns instead of rows
-concurrent_df = pd.concat([stage_df, regional_df], join='inner', axis=1)
+# find the dates (index values) that are common between the two dataframes
+concurrent_idx = stage_df.index.intersection(regional_df.index)
+# take just the columns we want on those dates, and name them to
+# something that is more indicative of the location of each data source
+concurrent_df = pd.DataFrame({'Regional_Q': regional_df.loc[concurrent_idx, 'flow'].to_numpy(),
+                              'Project_Q': stage_df.loc[concurrent_idx, 'RC Q (cms)'].to_numpy()},
+                             index=concurrent_idx)
 stage_df.index = pd.to_datetime(stage_df.index)
-# filter just the columns we want
-concurrent_df = concurrent_df[['flow', 'RC Q (cms)']]
-
-# not rename the columns to something that is more indicative of the location of each data source
-concurrent_df.columns = ['Regional_Q', 'Project_Q']
 
 # concurrent_df = concurrent_df[concurrent_df['Regional_Q'] < 6.0]
 
@@ -375,10 +372,9 @@ show(reg_plot)
 # In[26]:
 
 
-lt_series = regional_df.copy()[['flow']]
-lt_series.columns = ['Regional_Q']
+lt_series = regional_df[['flow']].rename(columns={'flow': 'Regional_Q'})
 # map the equation of the best fit line to the regional flow series
-lt_series['Proj_Q'] = lt_series.apply(lambda q: slope * q + intercept, axis=1)
+lt_series['Proj_Q'] = slope * lt_series['Regional_Q'] + intercept
 
 
 # ## Compare the Modelled vs. Measured Flow
@@ -387,11 +383,12 @@ lt_series['Proj_Q'] = lt_series.apply(lambda q: slope * q + intercept, axis=1)
 # In[27]:
 
 
-mod_df = pd.concat([stage_df, lt_series], join='inner', axis=1)
-# keep only the measured and modeled columns
-mod_df = mod_df[['RC Q (cms)', 'Proj_Q']]
-# rename the columns to something more intuitive
-mod_df.columns = ['Measured_Q', 'Modeled_Q']
+# keep only the measured and modeled columns on the common dates,
+# and give them more intuitive names
+mod_idx = stage_df.index.intersection(lt_series.index)
+mod_df = pd.DataFrame({'Measured_Q': stage_df.loc[mod_idx, 'RC Q (cms)'].to_numpy(),
+                       'Modeled_Q': lt_series.loc[mod_idx, 'Proj_Q'].to_numpy()},
+                      index=mod_idx)
 
 reg_plot = figure(plot_width=700, plot_height=400,
                 title='Measured vs. Modeled Daily Avg. Flow',
@@ -464,14 +461,14 @@ print('To compare, the median flow over the measured period was {:.1f} m^3/s'.fo
 
 
 lt_series['year'] = lt_series.index.year
-annual_series = lt_series[['Proj_Q', 'year']].groupby('year').mean()
+annual_series = lt_series.groupby('year')['Proj_Q'].mean()
 
 stage_df['year'] = stage_df.index.year
-msd_ann = stage_df[['year', 'RC Q (cms)']].groupby('year').mean()
+msd_ann = stage_df.groupby('year')['RC Q (cms)'].mean()
 
-plt.plot(annual_series['Proj_Q'], label='LT Modelled')
+plt.plot(annual_series.index, annual_series.to_numpy(), label='LT Modelled')
 plt.plot([1987, 2017], [lt_mad, lt_mad], label='LT Mean', color='green')
-plt.scatter(msd_ann.index, msd_ann['RC Q (cms)'], color='red')
+plt.scatter(msd_ann.index, msd_ann.to_numpy(), color='red')
 plt.title('Mean Annual Series')
 plt.legend()
 plt.show()
@@ -96,20 +96,18 @@ stage_range = np.linspace(0.001, 1.5, 100)
 bf_df = pd.DataFrame()
 bf_df['stage'] = stage_range
 
-# now as before, apply the `ols_rc_q` function to create the stage-discharge
-# curve based on the best-fit equation
-bf_df['best_fit_q'] = [ols_rc_q(log_slope, log_intercept, h, 0.0) for h in stage_range]
-bf_df.sort_values(by='stage', inplace=True)
+# now as before, use the `ols_rc_q` function to create the stage-discharge
+# curve based on the best-fit equation.  np.log and np.exp work on whole
+# arrays, so we can pass in the full stage range at once instead of looping
+bf_df['best_fit_q'] = ols_rc_q(log_slope, log_intercept, stage_range, 0.0)
 
 ## Calculate Daily Average Discharge
 
 From the equation describing the ordinary least squares (OLS) best fit of the measured discharge,
 calculate daily average flow from daily average water level.
 
-stage_df['RC Q (cms)'] = stage_df['Value'].apply(lambda h: ols_rc_q(log_slope, log_intercept, h, 0))
-stage_df['Date'] = stage_df.apply(lambda row: pd.to_datetime('{}-{}-{}'.format(row['year'], 
-                                                                               row['month'],
-                                                                              row['day'])), axis=1)
+stage_df['RC Q (cms)'] = ols_rc_q(log_slope, log_intercept, stage_df['Value'], 0)
+stage_df['Date'] = pd.to_datetime(stage_df[['year', 'month', 'day']])
 
 stage_df
 
@@ -242,18 +240,17 @@ print('SITE DATA: Start date = {}, End date = {}'.format(stage_df.index[0], stag
 
 ### Obtain Concurrent Data
 
-In the previous step, we can see that the regional dataset encompasses the date range of our site data.  To perform a regression, we want to use concurrent data only.   The `concat`, or concatenate, function [documentation can be found here](https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.concat.html). 
+In the previous step, we can see that the regional dataset encompasses the date range of our site data.  To perform a regression, we want to use concurrent data only.   The `Index.intersection` function finds the dates common to both datasets ([documentation can be found here](https://pandas.pydata.org/docs/reference/api/pandas.Index.intersection.html)), and `.loc` selects just the values we need on those dates. 
 
 # create a new dataframe of concurrent data and plot the data
-# join='inner' says to line up the indices and get the values that are common between the two dataframes
-# axis=1 says line up columns instead of rows
-concurrent_df = pd.concat([stage_df, regional_df], join='inner', axis=1)
+# find the dates (index values) that are common between the two dataframes
+concurrent_idx = stage_df.index.intersection(regional_df.index)
+# take just the columns we want on those dates, and name them to
+# something that is more indicative of the location of each data source
+concurrent_df = pd.DataFrame({'Regional_Q': regional_df.loc[concurrent_idx, 'flow'].to_numpy(),
+                              'Project_Q': stage_df.loc[concurrent_idx, 'RC Q (cms)'].to_numpy()},
+                             index=concurrent_idx)
 stage_df.index = pd.to_datetime(stage_df.index)
-# filter just the columns we want
-concurrent_df = concurrent_df[['flow', 'RC Q (cms)']]
-
-# not rename the columns to something that is more indicative of the location of each data source
-concurrent_df.columns = ['Regional_Q', 'Project_Q']
 
 # concurrent_df = concurrent_df[concurrent_df['Regional_Q'] < 6.0]
 
@@ -295,19 +292,19 @@ show(reg_plot)
 
 The last step in the process of a long-term flow estimate for our project location is to use the equation of the best fit line (the model) to calculate estimated daily flows over periods where flow was not measured at our project location.
 
-lt_series = regional_df.copy()[['flow']]
-lt_series.columns = ['Regional_Q']
+lt_series = regional_df[['flow']].rename(columns={'flow': 'Regional_Q'})
 # map the equation of the best fit line to the regional flow series
-lt_series['Proj_Q'] = lt_series.apply(lambda q: slope * q + intercept, axis=1)
+lt_series['Proj_Q'] = slope * lt_series['Regional_Q'] + intercept
 
 ## Compare the Modelled vs. Measured Flow
 
 
-mod_df = pd.concat([stage_df, lt_series], join='inner', axis=1)
-# keep only the measured and modeled columns
-mod_df = mod_df[['RC Q (cms)', 'Proj_Q']]
-# rename the columns to something more intuitive
-mod_df.columns = ['Measured_Q', 'Modeled_Q']
+# keep only the measured and modeled columns on the common dates,
+# and give them more intuitive names
+mod_idx = stage_df.index.intersection(lt_series.index)
+mod_df = pd.DataFrame({'Measured_Q': stage_df.loc[mod_idx, 'RC Q (cms)'].to_numpy(),
+                       'Modeled_Q': lt_series.loc[mod_idx, 'Proj_Q'].to_numpy()},
+                      index=mod_idx)
 
 reg_plot = figure(plot_width=700, plot_height=400,
                 title='Measured vs. Modeled Daily Avg. Flow',
@@ -364,14 +361,14 @@ print('The median flow for the long-term period was {:.1f} m^3/s'.format(lt_medi
 print('To compare, the median flow over the measured period was {:.1f} m^3/s'.format(msd_median))
 
 lt_series['year'] = lt_series.index.year
-annual_series = lt_series[['Proj_Q', 'year']].groupby('year').mean()
+annual_series = lt_series.groupby('year')['Proj_Q'].mean()
 
 stage_df['year'] = stage_df.index.year
-msd_ann = stage_df[['year', 'RC Q (cms)']].groupby('year').mean()
+msd_ann = stage_df.groupby('year')['RC Q (cms)'].mean()
 
-plt.plot(annual_series['Proj_Q'], label='LT Modelled')
+plt.plot(annual_series.index, annual_series.to_numpy(), label='LT Modelled')
 plt.plot([1987, 2017], [lt_mad, lt_mad], label='LT Mean', color='green')
-plt.scatter(msd_ann.index, msd_ann['RC Q (cms)'], color='red')
+plt.scatter(msd_ann.index, msd_ann.to_numpy(), color='red')
 plt.title('Mean Annual Series')
 plt.legend()
 plt.show()
@@ -393,11 +390,25 @@ plt.show()
 
 
 # drop incomplete years
-lt_series = lt_series[~lt_series['year'].isin([2001, 1983, 1984])]
+# (build the mask from the current frame so this cell can be re-run)
+lt_series = lt_series[~np.isin(lt_series['year'].to_numpy(), [2001, 1983, 1984])]
+# number of complete years remaining, used to annualize the energy totals
+n_years = lt_series['year'].nunique()
+
+def calc_sorted_percentiles(sorted_data, percentiles):
+    # same as np.percentile (linear interpolation), but takes data that
+    # is already sorted so it can be indexed directly instead of re-sorted
+    positions = np.asarray(percentiles) / 100 * (sorted_data.size - 1)
+    lower = np.floor(positions).astype(int)
+    upper = np.minimum(lower + 1, sorted_data.size - 1)
+    fraction = positions - lower
+    return sorted_data[lower] + (sorted_data[upper] - sorted_data[lower]) * fraction
+
+# sort the long-term flows once, all quantiles below are taken from this array
+# (NaNs were already dropped from lt_series above)
+proj_q_sorted = np.sort(lt_series['Proj_Q'].to_numpy())
 lt_mean = lt_series['Proj_Q'].mean()
-lt_median = np.percentile(lt_series['Proj_Q'], 50)
-
-import scipy
+lt_median = calc_sorted_percentiles(proj_q_sorted, 50)
 
 
 def calc_power(q_in):
@@ -407,12 +418,9 @@ def calc_power(q_in):
     
 def calc_flow_exceedance(q, qd, ifr):
     # calculate power based on flow exceedance flow
-    if q < ifr:
-        return 0
-    elif q < ifr + qd: # threshold must include ifr
-        return q
-    else:
-        return qd
+    # np.where evaluates the conditions over a whole array of flows at once
+    # threshold must include ifr
+    return np.where(q < ifr, 0, np.where(q < ifr + qd, q, qd))
 
 def calc_energy_daily(q_in):
     # calculate daily energy based on available flow
@@ -421,12 +429,8 @@ def calc_energy_daily(q_in):
 def calc_daily_flow(q_in, q_design, ifr):
     # calculate turbinable flow given inflows (q_in)
     # instream flow requirement (ifr), and maximum/design flow (q_design)
-    if q_in < ifr:
-        return 0
-    elif q_in < ifr + q_design:
-        return q_in
-    else:
-        return q_design
+    # q_in can be a single flow or an array of daily flows
+    return np.where(q_in < ifr, 0, np.where(q_in < ifr + q_design, q_in, q_design))
 
 # minimum IFR
 ifr = 0.9
@@ -443,36 +447,46 @@ student_mad = 4.0
 # qs = [student_median, student_mad, student_mad * 1.2, student_mad * 1.5]
 
 # get percentiles corresponding to median, MAD, 1.2MAD, 1.5MAD 
-qt_scores = [round((100-(scipy.stats.percentileofscore(lt_series['Proj_Q'], q)))/100, 2) for q in qs]
+# find where each design flow falls in the sorted series
+pct_scores = np.searchsorted(proj_q_sorted, qs, side='right') / proj_q_sorted.size * 100
+qt_scores = np.round((100 - pct_scores) / 100, 2)
 
 # find avg flow based on qt_scores
-def calc_area_under_fdc(data, qd, ifr):
+# (sorted_data must be a sorted numpy array, e.g. proj_q_sorted)
+def calc_area_under_fdc(sorted_data, qd, ifr):
     # calculate avg flow based on area under the FDC
     start, end = 0, 100
     n_steps = 100
     percentiles = np.linspace(start, end, n_steps)
     # calculate FDC for long term
-    q_vals = [np.percentile(data, p) for p in percentiles]
+    # (all percentiles are read from the pre-sorted data in one call)
+    q_vals = calc_sorted_percentiles(sorted_data, percentiles)
    
     # step size
     d_step = (end - start) / n_steps
 
     # set limit at design flow and filter out flows < ifr
-    fdc_flow_filtered = [q for q in np.clip(q_vals, a_min=0, a_max=qd) if q > 0.9]
-    fdc_effective_flow = sum([q * d_step for q in fdc_flow_filtered]) / n_steps
+    fdc_flow_clipped = np.clip(q_vals, a_min=0, a_max=qd)
+    fdc_flow_filtered = fdc_flow_clipped[fdc_flow_clipped > ifr]
+    fdc_effective_flow = (fdc_flow_filtered * d_step).sum() / n_steps
     fdc_energy = calc_power(fdc_effective_flow) * (8760 * (n_steps/100)) / 1E6
 
-    fdc_flow_estimate = sum(q_vals) / n_steps
+    fdc_flow_estimate = q_vals.sum() / n_steps
     
     return fdc_flow_estimate, fdc_energy
 
 
-for qd in qs:
+# calculate turbinable flow for every day (rows) and design flow (columns)
+# in one pass by broadcasting the daily flows against the design flows
+proj_q = lt_series['Proj_Q'].to_numpy()[:, None]
+q_turbine = calc_daily_flow(proj_q, np.asarray(qs)[None, :], ifr)
+# calculate daily energy based on turbinable flow
+energy_daily = calc_energy_daily(q_turbine)
+
+for i, qd in enumerate(qs):
     label = str(round(qd, 1))
-    # calculate turbinable flow
-    lt_series['q_turbine_{}'.format(label)] = [calc_daily_flow(q, qd, 0.9) for q in lt_series['Proj_Q']]
-    # calculate daily energy based on turbinable flow
-    lt_series['energy_{}cms'.format(label)] = [calc_energy_daily(q) for q in lt_series['q_turbine_{}'.format(label)]]
+    lt_series['q_turbine_{}'.format(label)] = q_turbine[:, i]
+    lt_series['energy_{}cms'.format(label)] = energy_daily[:, i]
 
 
 # iterate through design flows and corresponding exceedances 
@@ -488,13 +502,12 @@ for qd, fe, q_label in list(zip(qs, qt_scores, ['Median', '   MAD', '1.2MAD', '1
     cost = unit_cap_cost * qd
     
     # estimate energy production from fdc
-    fdc_flow, fdc_annual_energy = calc_area_under_fdc(lt_series['Proj_Q'], qd, ifr)
+    fdc_flow, fdc_annual_energy = calc_area_under_fdc(proj_q_sorted, qd, ifr)
     fdc_annual_rev = fdc_annual_energy * 0.04 
     fdc_total_energy = fdc_annual_energy * 20 / 1E6
     
     
     # estimate energy production from daily flows
-    n_years = len(set(lt_series['year']))
     series_label = str(round(qd, 1))
     # sum the daily energy generation, divide by number of years, convert to GWh
     ann_energy = lt_series['energy_{}cms'.format(series_label)].sum() / n_years / 1E6